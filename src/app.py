@@ -8,119 +8,132 @@ for extracurricular activities at Mergington High School.
 from fastapi import FastAPI, HTTPException
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import RedirectResponse
+import copy
 import os
 from pathlib import Path
 
-app = FastAPI(title="Mergington High School API",
-              description="API for viewing and signing up for extracurricular activities")
-
-# Mount the static files directory
 current_dir = Path(__file__).parent
-app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent,
-          "static")), name="static")
 
-# In-memory activity database
-activities = {
+# Initial activity catalog, copied into each app instance
+INITIAL_ACTIVITIES = {
     "Chess Club": {
         "description": "Learn strategies and compete in chess tournaments",
         "schedule": "Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+        "participants": {"michael@mergington.edu", "daniel@mergington.edu"}
     },
     "Programming Class": {
         "description": "Learn programming fundamentals and build software projects",
         "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
         "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+        "participants": {"emma@mergington.edu", "sophia@mergington.edu"}
     },
     "Gym Class": {
         "description": "Physical education and sports activities",
         "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
         "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+        "participants": {"john@mergington.edu", "olivia@mergington.edu"}
     },
     "Basketball Team": {
         "description": "Competitive basketball training and games",
         "schedule": "Tuesdays and Thursdays, 4:00 PM - 6:00 PM",
         "max_participants": 15,
-        "participants": ["james@mergington.edu"]
+        "participants": {"james@mergington.edu"}
     },
     "Swimming Club": {
         "description": "Swimming techniques and competitions",
         "schedule": "Mondays and Wednesdays, 3:30 PM - 5:00 PM",
         "max_participants": 25,
-        "participants": ["sarah@mergington.edu", "lucas@mergington.edu"]
+        "participants": {"sarah@mergington.edu", "lucas@mergington.edu"}
     },
     "Art Studio": {
         "description": "Explore painting, drawing, and mixed media art",
         "schedule": "Wednesdays, 3:30 PM - 5:30 PM",
         "max_participants": 18,
-        "participants": ["ava@mergington.edu"]
+        "participants": {"ava@mergington.edu"}
     },
     "Drama Club": {
         "description": "Theater performance, acting, and stage production",
         "schedule": "Thursdays, 4:00 PM - 6:00 PM",
         "max_participants": 20,
-        "participants": ["liam@mergington.edu", "mia@mergington.edu"]
+        "participants": {"liam@mergington.edu", "mia@mergington.edu"}
     },
     "Debate Team": {
         "description": "Develop critical thinking and public speaking skills",
         "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
         "max_participants": 16,
-        "participants": ["noah@mergington.edu"]
+        "participants": {"noah@mergington.edu"}
     },
     "Science Olympiad": {
         "description": "Competitive science and engineering challenges",
         "schedule": "Fridays, 3:00 PM - 5:00 PM",
         "max_participants": 24,
-        "participants": ["isabella@mergington.edu", "ethan@mergington.edu"]
+        "participants": {"isabella@mergington.edu", "ethan@mergington.edu"}
     }
 }
 
 
-@app.get("/")
-def root():
-    return RedirectResponse(url="/static/index.html")
+def make_app():
+    """Create the app together with its own in-memory activity database"""
+    app = FastAPI(title="Mergington High School API",
+                  description="API for viewing and signing up for extracurricular activities")
+
+    # Mount the static files directory
+    app.mount("/static", StaticFiles(directory=os.path.join(current_dir,
+              "static")), name="static")
+
+    # In-memory activity database
+    activities = copy.deepcopy(INITIAL_ACTIVITIES)
+
+    @app.get("/")
+    def root():
+        return RedirectResponse(url="/static/index.html")
 
+    @app.get("/activities")
+    def get_activities():
+        # Participants are stored as sets; return them as sorted lists
+        return {
+            name: {**details, "participants": sorted(details["participants"])}
+            for name, details in activities.items()
+        }
 
-@app.get("/activities")
-def get_activities():
-    return activities
+    @app.post("/activities/{activity_name}/signup")
+    def signup_for_activity(activity_name: str, email: str):
+        """Sign up a student for an activity"""
+        # Validate activity exists
+        if activity_name not in activities:
+            raise HTTPException(status_code=404, detail="Activity not found")
 
+        # Get the specific activity
+        activity = activities[activity_name]
 
-@app.post("/activities/{activity_name}/signup")
-def signup_for_activity(activity_name: str, email: str):
-    """Sign up a student for an activity"""
-    # Validate activity exists
-    if activity_name not in activities:
-        raise HTTPException(status_code=404, detail="Activity not found")
+        # Validate student is not already signed up
+        if email in activity["participants"]:
+            raise HTTPException(status_code=400, detail="Student already signed up for this activity")
 
-    # Get the specific activity
-    activity = activities[activity_name]
+        # Add student
+        activity["participants"].add(email)
+        return {"message": f"Signed up {email} for {activity_name}"}
 
-    # Validate student is not already signed up
-    if email in activity["participants"]:
-        raise HTTPException(status_code=400, detail="Student already signed up for this activity")
+    @app.delete("/activities/{activity_name}/unregister")
+    def unregister_from_activity(activity_name: str, email: str):
+        """Unregister a student from an activity"""
+        # Validate activity exists
+        if activity_name not in activities:
+            raise HTTPException(status_code=404, detail="Activity not found")
 
-    # Add student
-    activity["participants"].append(email)
-    return {"message": f"Signed up {email} for {activity_name}"}
+        # Get the specific activity
+        activity = activities[activity_name]
 
+        # Validate student is signed up
+        if email not in activity["participants"]:
+            raise HTTPException(status_code=400, detail="Student not found in this activity")
 
-@app.delete("/activities/{activity_name}/unregister")
-def unregister_from_activity(activity_name: str, email: str):
-    """Unregister a student from an activity"""
-    # Validate activity exists
-    if activity_name not in activities:
-        raise HTTPException(status_code=404, detail="Activity not found")
+        # Remove student
+        activity["participants"].remove(email)
+        return {"message": f"Unregistered {email} from {activity_name}"}
 
-    # Get the specific activity
-    activity = activities[activity_name]
+    return app, activities
 
-    # Validate student is signed up
-    if email not in activity["participants"]:
-        raise HTTPException(status_code=400, detail="Student not found in this activity")
 
-    # Remove student
-    activity["participants"].remove(email)
-    return {"message": f"Unregistered {email} from {activity_name}"}
+app, activities = make_app()
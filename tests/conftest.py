@@ -0,0 +1,85 @@
+"""
+Shared fixtures for the Mergington High School API tests
+"""
+
+import httpx
+import orjson
+import pytest
+from src.app import make_app
+
+
+def json_body(response):
+    """Decode a response body with orjson"""
+    return orjson.loads(response.content)
+
+
+@pytest.fixture(scope="session")
+def app_and_state():
+    """Create an app with its own activities data for this test session.
+
+    Each pytest-xdist worker runs its own session, so workers never share
+    state.
+    """
+    return make_app()
+
+
+@pytest.fixture(scope="session")
+def app(app_and_state):
+    """The FastAPI app under test"""
+    return app_and_state[0]
+
+
+@pytest.fixture(scope="session")
+def activities(app_and_state):
+    """The in-memory activities database backing the app under test"""
+    return app_and_state[1]
+
+
+@pytest.fixture(scope="session")
+def _activities_baseline(activities):
+    """Snapshot the original participants of each activity once per session"""
+    return tuple(
+        (name, frozenset(details["participants"]))
+        for name, details in activities.items()
+    )
+
+
+@pytest.fixture
+def reset_state(activities, _activities_baseline):
+    """Restore any participants sets changed by a test"""
+    yield
+
+    for name, baseline_participants in _activities_baseline:
+        if activities[name]["participants"] != baseline_participants:
+            activities[name]["participants"] = set(baseline_participants)
+
+
+def pytest_collection_modifyitems(items):
+    """Attach reset_state to every test marked as mutating app state"""
+    for item in items:
+        if item.get_closest_marker("mutates_state") and "reset_state" not in item.fixturenames:
+            item.fixturenames.append("reset_state")
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    """Run async tests on asyncio only"""
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+async def async_client(app):
+    """Create a single, warmed-up async client that calls the app in-process"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        # Send one request up front so routing and serialization are ready
+        await client.get("/activities")
+        yield client
+
+
+@pytest.fixture(scope="session")
+async def activities_snapshot(async_client):
+    """Fetch the GET /activities response body once for read-only tests"""
+    response = await async_client.get("/activities")
+    assert response.status_code == 200
+    return json_body(response)
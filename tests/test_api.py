@@ -2,45 +2,36 @@
 Tests for the Mergington High School API endpoints
 """
 
+import asyncio
+from urllib.parse import quote
+
 import pytest
-from fastapi.testclient import TestClient
-from src.app import app, activities
-
-
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
-
-
-@pytest.fixture(autouse=True)
-def reset_activities():
-    """Reset activities data before each test"""
-    # Store original state
-    original_activities = {
-        name: {
-            "description": details["description"],
-            "schedule": details["schedule"],
-            "max_participants": details["max_participants"],
-            "participants": details["participants"].copy()
-        }
-        for name, details in activities.items()
-    }
-    
-    yield
-    
-    # Restore original state after test
-    for name in activities:
-        if name in original_activities:
-            activities[name]["participants"] = original_activities[name]["participants"].copy()
+from src.app import INITIAL_ACTIVITIES
+from tests.conftest import json_body
+
+
+pytestmark = pytest.mark.anyio
+
+
+# URL path for each activity used in requests, encoded once at import
+ACTIVITY_PATHS = {
+    name: f"/activities/{quote(name)}"
+    for name in (
+        "Chess Club",
+        "Programming Class",
+        "Gym Class",
+        "Art Studio",
+        "Nonexistent Club",
+    )
+}
 
 
 class TestRootEndpoint:
     """Tests for the root endpoint"""
     
-    def test_root_redirects_to_static_index(self, client):
+    async def test_root_redirects_to_static_index(self, async_client):
         """Test that root endpoint redirects to static/index.html"""
-        response = client.get("/", follow_redirects=False)
+        response = await async_client.get("/", follow_redirects=False)
         assert response.status_code == 307
         assert response.headers["location"] == "/static/index.html"
 
@@ -48,12 +39,9 @@ class TestRootEndpoint:
 class TestGetActivities:
     """Tests for the GET /activities endpoint"""
     
-    def test_get_activities_returns_all_activities(self, client):
+    async def test_get_activities_returns_all_activities(self, activities_snapshot):
         """Test that all activities are returned"""
-        response = client.get("/activities")
-        assert response.status_code == 200
-        
-        data = response.json()
+        data = activities_snapshot
         assert isinstance(data, dict)
         assert len(data) > 0
         
@@ -62,188 +50,163 @@ class TestGetActivities:
         assert "Programming Class" in data
         assert "Gym Class" in data
     
-    def test_activity_structure(self, client):
+    @pytest.mark.parametrize("activity_name", list(INITIAL_ACTIVITIES))
+    async def test_activity_structure(self, activities_snapshot, activity_name):
         """Test that each activity has the correct structure"""
-        response = client.get("/activities")
-        data = response.json()
-        
-        for activity_name, activity_details in data.items():
-            assert "description" in activity_details
-            assert "schedule" in activity_details
-            assert "max_participants" in activity_details
-            assert "participants" in activity_details
-            assert isinstance(activity_details["participants"], list)
+        activity_details = activities_snapshot[activity_name]
+        assert "description" in activity_details
+        assert "schedule" in activity_details
+        assert "max_participants" in activity_details
+        assert "participants" in activity_details
+        assert isinstance(activity_details["participants"], list)
 
 
 class TestSignupForActivity:
     """Tests for the POST /activities/{activity_name}/signup endpoint"""
+
+    pytestmark = pytest.mark.mutates_state
     
-    def test_successful_signup(self, client):
+    async def test_successful_signup(self, async_client, activities):
         """Test successful signup for an activity"""
-        response = client.post(
-            "/activities/Chess Club/signup?email=test@mergington.edu"
+        response = await async_client.post(
+            f"{ACTIVITY_PATHS['Chess Club']}/signup?email=test@mergington.edu"
         )
         assert response.status_code == 200
         
-        data = response.json()
+        data = json_body(response)
         assert "message" in data
         assert "test@mergington.edu" in data["message"]
         assert "Chess Club" in data["message"]
         
         # Verify the participant was added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "test@mergington.edu" in activities_data["Chess Club"]["participants"]
-    
-    def test_signup_for_nonexistent_activity(self, client):
-        """Test signup for an activity that doesn't exist"""
-        response = client.post(
-            "/activities/Nonexistent Club/signup?email=test@mergington.edu"
-        )
-        assert response.status_code == 404
-        assert "Activity not found" in response.json()["detail"]
-    
-    def test_duplicate_signup(self, client):
-        """Test that a student cannot sign up twice for the same activity"""
-        email = "duplicate@mergington.edu"
-        
-        # First signup
-        response1 = client.post(
-            f"/activities/Chess Club/signup?email={email}"
-        )
-        assert response1.status_code == 200
-        
-        # Second signup (should fail)
-        response2 = client.post(
-            f"/activities/Chess Club/signup?email={email}"
-        )
-        assert response2.status_code == 400
-        assert "already signed up" in response2.json()["detail"]
+        assert "test@mergington.edu" in activities["Chess Club"]["participants"]
     
-    def test_signup_with_special_characters_in_activity_name(self, client):
-        """Test signup with URL-encoded activity name"""
-        response = client.post(
-            "/activities/Art%20Studio/signup?email=test@mergington.edu"
-        )
-        assert response.status_code == 200
+    @pytest.mark.parametrize(
+        "activity,email,expected_status,expected_detail_fragment",
+        [
+            ("Nonexistent Club", "test@mergington.edu", 404, "Activity not found"),
+            ("Chess Club", "michael@mergington.edu", 400, "already signed up"),
+            ("Art Studio", "test@mergington.edu", 200, "Signed up test@mergington.edu"),
+        ],
+        ids=["nonexistent-activity", "duplicate-signup", "url-encoded-activity-name"],
+    )
+    async def test_signup_responses(
+        self, async_client, activity, email, expected_status, expected_detail_fragment
+    ):
+        """Test signup status codes and messages for each scenario"""
+        response = await async_client.post(f"{ACTIVITY_PATHS[activity]}/signup?email={email}")
+        assert response.status_code == expected_status
+        assert expected_detail_fragment in response.text
 
 
 class TestUnregisterFromActivity:
     """Tests for the DELETE /activities/{activity_name}/unregister endpoint"""
+
+    pytestmark = pytest.mark.mutates_state
     
-    def test_successful_unregister(self, client):
+    async def test_successful_unregister(self, async_client, activities):
         """Test successful unregistration from an activity"""
         email = "unregister@mergington.edu"
         
         # First, sign up
-        client.post(f"/activities/Chess Club/signup?email={email}")
+        await async_client.post(f"{ACTIVITY_PATHS['Chess Club']}/signup?email={email}")
         
         # Then unregister
-        response = client.delete(
-            f"/activities/Chess Club/unregister?email={email}"
+        response = await async_client.delete(
+            f"{ACTIVITY_PATHS['Chess Club']}/unregister?email={email}"
         )
         assert response.status_code == 200
         
-        data = response.json()
+        data = json_body(response)
         assert "message" in data
         assert "Unregistered" in data["message"]
         assert email in data["message"]
         
         # Verify the participant was removed
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email not in activities_data["Chess Club"]["participants"]
-    
-    def test_unregister_from_nonexistent_activity(self, client):
-        """Test unregister from an activity that doesn't exist"""
-        response = client.delete(
-            "/activities/Nonexistent Club/unregister?email=test@mergington.edu"
-        )
-        assert response.status_code == 404
-        assert "Activity not found" in response.json()["detail"]
+        assert email not in activities["Chess Club"]["participants"]
     
-    def test_unregister_participant_not_in_activity(self, client):
-        """Test unregistering a participant who isn't signed up"""
-        response = client.delete(
-            "/activities/Chess Club/unregister?email=notregistered@mergington.edu"
-        )
-        assert response.status_code == 400
-        assert "not found in this activity" in response.json()["detail"]
+    @pytest.mark.parametrize(
+        "activity,email,expected_status,expected_detail_fragment",
+        [
+            ("Nonexistent Club", "test@mergington.edu", 404, "Activity not found"),
+            ("Chess Club", "notregistered@mergington.edu", 400, "not found in this activity"),
+        ],
+        ids=["nonexistent-activity", "participant-not-in-activity"],
+    )
+    async def test_unregister_error_responses(
+        self, async_client, activity, email, expected_status, expected_detail_fragment
+    ):
+        """Test unregister status codes and messages for each error scenario"""
+        response = await async_client.delete(f"{ACTIVITY_PATHS[activity]}/unregister?email={email}")
+        assert response.status_code == expected_status
+        assert expected_detail_fragment in response.text
     
-    def test_unregister_existing_participant(self, client):
+    async def test_unregister_existing_participant(self, async_client, activities):
         """Test unregistering an existing participant"""
-        # Get initial participants
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        
         # Pick an activity with participants
-        chess_participants = activities_data["Chess Club"]["participants"]
+        chess_participants = activities["Chess Club"]["participants"]
         if len(chess_participants) > 0:
-            email_to_remove = chess_participants[0]
+            email_to_remove = min(chess_participants)
             
-            response = client.delete(
-                f"/activities/Chess Club/unregister?email={email_to_remove}"
+            response = await async_client.delete(
+                f"{ACTIVITY_PATHS['Chess Club']}/unregister?email={email_to_remove}"
             )
             assert response.status_code == 200
             
             # Verify removal
-            activities_response = client.get("/activities")
-            activities_data = activities_response.json()
-            assert email_to_remove not in activities_data["Chess Club"]["participants"]
+            assert email_to_remove not in chess_participants
 
 
 class TestIntegration:
     """Integration tests for multiple operations"""
+
+    pytestmark = pytest.mark.mutates_state
     
-    def test_signup_and_unregister_flow(self, client):
+    async def test_signup_and_unregister_flow(self, async_client, activities):
         """Test complete flow of signing up and then unregistering"""
         email = "flow@mergington.edu"
         activity = "Programming Class"
         
         # Get initial participant count
-        response = client.get("/activities")
-        initial_count = len(response.json()[activity]["participants"])
+        participants = activities[activity]["participants"]
+        initial_count = len(participants)
         
         # Sign up
-        signup_response = client.post(
-            f"/activities/{activity}/signup?email={email}"
+        signup_response = await async_client.post(
+            f"{ACTIVITY_PATHS[activity]}/signup?email={email}"
         )
         assert signup_response.status_code == 200
-        
-        # Verify signup
-        response = client.get("/activities")
-        assert len(response.json()[activity]["participants"]) == initial_count + 1
-        assert email in response.json()[activity]["participants"]
+        assert email in participants
         
         # Unregister
-        unregister_response = client.delete(
-            f"/activities/{activity}/unregister?email={email}"
+        unregister_response = await async_client.delete(
+            f"{ACTIVITY_PATHS[activity]}/unregister?email={email}"
         )
         assert unregister_response.status_code == 200
         
-        # Verify unregister
-        response = client.get("/activities")
-        assert len(response.json()[activity]["participants"]) == initial_count
-        assert email not in response.json()[activity]["participants"]
+        # Verify final state
+        assert len(participants) == initial_count
+        assert email not in participants
     
-    def test_multiple_signups_different_activities(self, client):
+    async def test_multiple_signups_different_activities(self, async_client, activities):
         """Test that a student can sign up for multiple activities"""
         email = "multi@mergington.edu"
         
-        # Sign up for multiple activities
-        response1 = client.post(f"/activities/Chess Club/signup?email={email}")
-        assert response1.status_code == 200
-        
-        response2 = client.post(f"/activities/Programming Class/signup?email={email}")
-        assert response2.status_code == 200
-        
-        response3 = client.post(f"/activities/Gym Class/signup?email={email}")
-        assert response3.status_code == 200
+        # Sign up for multiple activities concurrently
+        responses = await asyncio.gather(
+            async_client.post(f"{ACTIVITY_PATHS['Chess Club']}/signup?email={email}"),
+            async_client.post(f"{ACTIVITY_PATHS['Programming Class']}/signup?email={email}"),
+            async_client.post(f"{ACTIVITY_PATHS['Gym Class']}/signup?email={email}"),
+        )
+        for response in responses:
+            assert response.status_code == 200
         
         # Verify the student is in all three activities
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        
-        assert email in activities_data["Chess Club"]["participants"]
-        assert email in activities_data["Programming Class"]["participants"]
-        assert email in activities_data["Gym Class"]["participants"]
+        activities_response = await async_client.get("/activities")
+        assert activities_response.status_code == 200
+        activities_data = json_body(activities_response)
+        
+        for activity in ("Chess Club", "Programming Class", "Gym Class"):
+            participants = activities_data[activity]["participants"]
+            assert email in participants
+            assert participants == sorted(activities[activity]["participants"])